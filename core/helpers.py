@@ -1,7 +1,10 @@
 import argparse
+import csv
+import io
 import unicodedata
 import re
 from pathlib import Path
+from typing import Any, Iterable
 import pandas as pd
 import numpy as np
 
@@ -23,8 +26,7 @@ def valid_date(value: str) -> str:
     if len(value) != 6 or not value.isdigit():
         raise argparse.ArgumentTypeError("La date doit être au format AAAAMM, ex: 202511")
 
-    year = int(value[:4])
-    month = int(value[4:6])
+    year, month = divmod(int(value), 100)
 
     if not (1 <= month <= 12):
         raise argparse.ArgumentTypeError(f"Mois invalide ({month}) dans la date '{value}'")
@@ -35,10 +37,18 @@ def valid_date(value: str) -> str:
     return value
 
 
+# Motifs de `normalize`, compilés une seule fois au chargement du module
+_HYPHENATED_WORD_RE = re.compile(r"(\w)-\s+(\w)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def normalize(text: str) -> str:
     """
     Convertit le texte en minuscules, sans accents ni sauts étranges.
 
+    La décomposition NFKD (et le retrait des signes diacritiques) n'est appliquée
+    que si le texte contient des caractères non ASCII.
+
     Args:
         text (str): Le texte á normaliser.
 
@@ -46,30 +56,89 @@ def normalize(text: str) -> str:
         str: Texte normalisé.
     """
     text = text.lower()
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(c for c in text if not unicodedata.combining(c))
-    text = text.replace("’", "'")
-    text = text.replace("‐", "-")  # guion Unicode raro → ASCII
-    text = re.sub(r"(\w)-\s+(\w)", r"\1\2", text)  # fusionne mots coupés
+    if not text.isascii():
+        combining = unicodedata.combining
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join([c for c in text if not combining(c)])
+        text = text.replace("’", "'")
+        text = text.replace("‐", "-")  # guion Unicode raro → ASCII
+    text = _HYPHENATED_WORD_RE.sub(r"\1\2", text)  # fusionne mots coupés
     text = text.replace("-", " ")  # ← unifica guiones a espacio
     text = text.replace("\n", " ")
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
+def _read_survey_keys(lines: Iterable[str], csv_path: Path) -> tuple[list[str], set[tuple[str, str]]]:
+    """
+    Lit l'en-tête et l'ensemble des paires (poll_id, population) d'un fichier CSV des sondages.
+
+    Args:
+        lines: Contenu du fichier (flux texte ou itérable de lignes), lu sans conversion de fin de ligne.
+        csv_path: Chemin du fichier, utilisé uniquement dans le message d'erreur.
+
+    Raises:
+        ValueError: Si l'en-tête ne contient pas les colonnes 'poll_id' et 'population'.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, [])
+    if "poll_id" not in header or "population" not in header:
+        raise ValueError(f"Colonnes 'poll_id' et 'population' requises dans {csv_path}")
+
+    i, j = header.index("poll_id"), header.index("population")
+    return header, {(row[i], row[j]) for row in reader if len(row) > max(i, j)}
+
+
 def survey_exists(csv_path: Path, poll_id: str, population: str) -> bool:
     """
     Vérifiez si un sondage existe déjà dans le fichier CSV des sondages.
 
     Un sondage est considéré comme unique par la paire (poll_id, population).
+    Le fichier est lu ligne par ligne et la lecture s'arrête à la première correspondance.
     """
-    df = pd.read_csv(
-        csv_path,
-        usecols=["poll_id", "population"],
-        dtype=str,
-    )
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["poll_id"] == poll_id and row["population"] == population:
+                return True
 
-    return ((df["poll_id"] == poll_id) & (df["population"] == population)).any()
+    return False
+
+
+def append_surveys(csv_path: Path, surveys: list[dict[str, Any]]) -> list[bool]:
+    """
+    Ajoute en une seule écriture les sondages absents du fichier CSV des sondages.
+
+    Le fichier n'est ouvert qu'une seule fois pour vérifier l'existence des paires
+    (poll_id, population), garantir le saut de ligne final et écrire les nouvelles lignes.
+    Les valeurs sont écrites dans l'ordre des colonnes de l'en-tête ; une colonne absente
+    d'un sondage est laissée vide. Une paire répétée dans `surveys` n'est ajoutée qu'une fois.
+
+    Returns:
+        list[bool]: pour chaque sondage, True s'il a été ajouté, False s'il existait déjà.
+    """
+    with open(csv_path, "r+b") as f:
+        content = f.read()
+
+        header, existing = _read_survey_keys(io.StringIO(content.decode("utf-8"), newline=""), csv_path)
+
+        lines = io.StringIO()
+        writer = csv.writer(lines, lineterminator="\n")
+        added = []
+        for survey in surveys:
+            key = (str(survey["poll_id"]), str(survey["population"]))
+            is_new = key not in existing
+            if is_new:
+                existing.add(key)
+                writer.writerow([survey.get(col, "") for col in header])
+            added.append(is_new)
+
+        if any(added):
+            # Le curseur est déjà en fin de fichier après la lecture
+            if content and not content.endswith(b"\n"):
+                f.write(b"\n")
+            f.write(lines.getvalue().encode("utf-8"))
+
+    return added
 
 
 def normalize_to_100(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
@@ -85,33 +154,33 @@ def normalize_to_100(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: copie normalisée des colonnes fournies (valeurs entières).
     """
-    values = df[columns].astype(float)
+    values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        raise ValueError("Impossible de normaliser des lignes contenant des valeurs manquantes")
 
     totals = values.sum(axis=1)
     if (totals <= 0).any():
         raise ValueError("Impossible de normaliser des lignes dont la somme <= 0")
 
     # Normalisation proportionnelle
-    normalized = values.div(totals, axis=0).mul(100)
+    normalized = values / totals[:, None] * 100
 
     # Partie entière
-    floored = normalized.astype(int)
+    floored = normalized.astype(np.int64)
     # Parties décimales
     decimals = normalized - floored
 
     # Résidu à redistribuer
     residual = 100 - floored.sum(axis=1)
 
-    # Redistribution (plus grands restes)
-    for i in residual.index:
-        if residual.loc[i] <= 0:
-            continue
-
-        ordered_cols = decimals.loc[i].sort_values(ascending=False).index
-        for col in ordered_cols:
-            if residual.loc[i] == 0:
-                break
-            floored.loc[i, col] += 1
-            residual.loc[i] -= 1
-
-    return floored
+    # Redistribution (plus grands restes) : rang de chaque colonne par partie
+    # décimale décroissante, puis +1 sur les `residual` premières de chaque ligne.
+    # Tri complet et stable plutôt que np.argpartition : les égalités sont départagées
+    # par l'ordre des colonnes, et le nombre de colonnes (mentions) reste très petit.
+    nb_cols = decimals.shape[1]
+    order = np.argsort(-decimals, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(nb_cols), order.shape), axis=1)
+    floored += ranks < residual[:, None]
+
+    return pd.DataFrame(floored, index=df.index, columns=columns)
@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from types import MappingProxyType
 from core.helpers import normalize
 
 
@@ -47,34 +48,17 @@ class Population(str, Enum):
     @property
     def label(self) -> str:
         """Étiquette lisible"""
-        LABELS = {
-            "all": "Ensemble des Français",
-            "left": "Électeurs de gauche",
-            "macron": "Électeurs d'Emmanuel Macron",
-            "farright": "Électeurs d'extrême droite",
-            "absentionists": "Abstentionnistes",
-            "lepen": "Électeurs de Marine Le Pen 2022",
-            "melenchon": "Électeurs de Jean-Luc Mélenchon 2022",
-            "lfi": "Électeurs de LFI aux Européennes 2024",
-            "ecologistes": "Électeurs Les Ecologistes aux Européennes 2024",
-            "pspp": "Électeurs PS/PP aux Européennes 2024",
-            "renaissance": "Électeurs Renaissance aux Européennes 2024",
-            "lr": "Électeurs LR aux Européennes 2024",
-            "rn": "Électeurs RN aux Européennes 2024",
-            "reconquete": "Électeurs Reconquête aux Européennes 2024",
-        }
-        return LABELS[self.value]
+        return _LABELS[self.value]
 
     @classmethod
     def by_survey(cls, survey_name: str) -> list["Population"]:
         """Retourne les populations appartenant à une enquête donnée (ex: 'CLUSTER17')."""
-        populations = cls.__SURVEY_MAP__.get(survey_name.upper(), [])
-        return [p for p in cls if p.value in populations]
+        return list(_POPULATIONS_BY_SURVEY.get(survey_name.upper(), ()))
 
     @classmethod
     def surveys_for(cls, population: "Population") -> list[str]:
         """Retourne les enquêtes dans lesquelles une population est présente."""
-        return [name for name, pops in cls.__SURVEY_MAP__.items() if population.value in pops]
+        return list(_SURVEYS_BY_POPULATION[population])
 
     @classmethod
     def detect_from_text(cls, text: str) -> tuple["Population", str] | None:
@@ -82,78 +66,125 @@ class Population(str, Enum):
 
         text = normalize(text)
 
-        # Mots-clés (patterns de détection en version minimale, aplatie et sans accents.)
-        KEYWORDS = {
-            cls.ALL: [
-                "ensemble des francais",
-                "tous les francais",
-                "l'ensemble des francais",
-                (
-                    "concernant les personnalites politiques suivantes, pouvez "
-                    "vous nous dire pour chacune d'entre elle si vous la soutenez, "
-                    "si vous l'appreciez, si vous ne l'appreciez pas, si vous ne la "
-                    "connaissez pas ou si vous n'avez pas d'avis sur elle ?"
-                ),
-            ],
-            cls.LEFT: ["electeurs de gauche", "sympathisants de gauche", "electeurs de gauche et des ecologistes"],
-            cls.MACRON: [
-                "electeurs d'emmanuel macron",
-                "electeurs de macron",
-                "macronistes",
-                "electeurs emmanuel macron 2022",
-            ],
-            cls.FARRIGHT: ["electeurs de marine le pen et d'eric zemmour", "electeurs d'extreme droite"],
-            cls.ABSTENTIONISTS: ["abstentionnistes", "votes blancs et nuls", "non inscrits", "non-inscrits"],
-            cls.JLMELENCHON: [
-                "jean-luc melenchon",
-                "melenchon 2022",
-                "electeurs de jean-luc melenchon 2022",
-            ],
-            cls.MLPEN: [
-                "marine le pen",
-                "marine le pen 2022",
-                "electeurs marine le pen 2022",
-            ],
-            cls.LFI: ["electeurs lfi", "electeurs lfi europeennes 2024", "electeurs lfi europeennes aux 2024"],
-            cls.ECOLOGISTES: [
-                "electeurs ecologistes",
-                "les ecologistes europeennes",
-                "electeurs les ecologistes europeennes 2024",
-                "electeurs les ecologistes aux europeennes 2024",
-            ],
-            cls.PSPP: [
-                "electeurs ps/pp aux europeennes 2024",
-                "electeurs ps/pp europeennes 2024",
-                "ps/pp aux europeennes 2024",
-                "ps/pp",
-            ],
-            cls.RENAISSANCE: [
-                "electeurs renaissance aux europeennes 2024",
-                "electeurs renaissance",
-                "renaissance europeennes 2024",
-            ],
-            cls.LR: ["electeurs lr aux europeennes 2024", "electeurs lr", "les lr", "lr europeennes 2024"],
-            cls.RN: [
-                "electeurs rn aux europeennes 2024",
-                "electeurs rn",
-                "les rn",
-                "rassemblement national europeennes 2024",
-                "rn europeennes 2024",
-                "rassemblement national",
-                "electeurs de rassemblement national",
-            ],
-            cls.RECONQUETE: [
-                "electeurs reconquete aux europeennes 2024",
-                "electeurs reconquete",
-                "reconquete europeennes 2024",
-            ],
-        }
-
-        for pop, keywords in KEYWORDS.items():
-            for kw in keywords:
-                if kw.replace(" ", "") in text.replace(" ", ""):
-                    pattern = re.sub(r"\s+", r"\\s*", kw)
-                    if re.search(pattern, text):
-                        return pop, pop.label
+        for pop, pattern in _KEYWORD_PATTERNS.items():
+            if pattern.search(text):
+                return pop, pop.label
 
         return None
+
+
+# Étiquettes lisibles par population
+_LABELS = MappingProxyType(
+    {
+        "all": "Ensemble des Français",
+        "left": "Électeurs de gauche",
+        "macron": "Électeurs d'Emmanuel Macron",
+        "farright": "Électeurs d'extrême droite",
+        "absentionists": "Abstentionnistes",
+        "lepen": "Électeurs de Marine Le Pen 2022",
+        "melenchon": "Électeurs de Jean-Luc Mélenchon 2022",
+        "lfi": "Électeurs de LFI aux Européennes 2024",
+        "ecologistes": "Électeurs Les Ecologistes aux Européennes 2024",
+        "pspp": "Électeurs PS/PP aux Européennes 2024",
+        "renaissance": "Électeurs Renaissance aux Européennes 2024",
+        "lr": "Électeurs LR aux Européennes 2024",
+        "rn": "Électeurs RN aux Européennes 2024",
+        "reconquete": "Électeurs Reconquête aux Européennes 2024",
+    }
+)
+
+# Index précalculés à partir de __SURVEY_MAP__ (constant après la définition de la classe)
+_POPULATIONS_BY_SURVEY = MappingProxyType(
+    {
+        survey: tuple(p for p in Population if p.value in populations)
+        for survey, populations in Population.__SURVEY_MAP__.items()
+    }
+)
+_SURVEYS_BY_POPULATION = MappingProxyType(
+    {
+        p: tuple(survey for survey, populations in Population.__SURVEY_MAP__.items() if p.value in populations)
+        for p in Population
+    }
+)
+
+# Mots-clés (patterns de détection en version minimale, aplatie et sans accents.)
+# L'ordre des populations définit la priorité de détection.
+_KEYWORDS = {
+    Population.ALL: [
+        "ensemble des francais",
+        "tous les francais",
+        "l'ensemble des francais",
+        (
+            "concernant les personnalites politiques suivantes, pouvez "
+            "vous nous dire pour chacune d'entre elle si vous la soutenez, "
+            "si vous l'appreciez, si vous ne l'appreciez pas, si vous ne la "
+            "connaissez pas ou si vous n'avez pas d'avis sur elle ?"
+        ),
+    ],
+    Population.LEFT: ["electeurs de gauche", "sympathisants de gauche", "electeurs de gauche et des ecologistes"],
+    Population.MACRON: [
+        "electeurs d'emmanuel macron",
+        "electeurs de macron",
+        "macronistes",
+        "electeurs emmanuel macron 2022",
+    ],
+    Population.FARRIGHT: ["electeurs de marine le pen et d'eric zemmour", "electeurs d'extreme droite"],
+    Population.ABSTENTIONISTS: ["abstentionnistes", "votes blancs et nuls", "non inscrits", "non-inscrits"],
+    Population.JLMELENCHON: [
+        "jean-luc melenchon",
+        "melenchon 2022",
+        "electeurs de jean-luc melenchon 2022",
+    ],
+    Population.MLPEN: [
+        "marine le pen",
+        "marine le pen 2022",
+        "electeurs marine le pen 2022",
+    ],
+    Population.LFI: ["electeurs lfi", "electeurs lfi europeennes 2024", "electeurs lfi europeennes aux 2024"],
+    Population.ECOLOGISTES: [
+        "electeurs ecologistes",
+        "les ecologistes europeennes",
+        "electeurs les ecologistes europeennes 2024",
+        "electeurs les ecologistes aux europeennes 2024",
+    ],
+    Population.PSPP: [
+        "electeurs ps/pp aux europeennes 2024",
+        "electeurs ps/pp europeennes 2024",
+        "ps/pp aux europeennes 2024",
+        "ps/pp",
+    ],
+    Population.RENAISSANCE: [
+        "electeurs renaissance aux europeennes 2024",
+        "electeurs renaissance",
+        "renaissance europeennes 2024",
+    ],
+    Population.LR: ["electeurs lr aux europeennes 2024", "electeurs lr", "les lr", "lr europeennes 2024"],
+    Population.RN: [
+        "electeurs rn aux europeennes 2024",
+        "electeurs rn",
+        "les rn",
+        "rassemblement national europeennes 2024",
+        "rn europeennes 2024",
+        "rassemblement national",
+        "electeurs de rassemblement national",
+    ],
+    Population.RECONQUETE: [
+        "electeurs reconquete aux europeennes 2024",
+        "electeurs reconquete",
+        "reconquete europeennes 2024",
+    ],
+}
+
+
+def _compile_keywords(keywords: list[str]) -> re.Pattern:
+    """
+    Compile les mots-clés d'une population en une seule expression régulière.
+
+    Les espaces entre les mots d'un mot-clé sont facultatifs (ex: "electeurs lr"
+    correspond aussi à "electeurslr"), les mots eux-mêmes sont recherchés littéralement.
+    """
+    return re.compile("|".join(r"\s*".join(re.escape(word) for word in kw.split()) for kw in keywords))
+
+
+# Expressions compilées une seule fois au chargement : une recherche par population
+_KEYWORD_PATTERNS = {pop: _compile_keywords(keywords) for pop, keywords in _KEYWORDS.items()}
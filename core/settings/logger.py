@@ -10,12 +10,22 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Niveau avec lequel le logging a déjà été configuré (None tant que setup_logging n'a pas été appelé)
+_CONFIGURED_LEVEL: LogLevel | None = None
+
+
 def setup_logging(settings=None) -> None:
+    global _CONFIGURED_LEVEL
 
     # Define different format if it is DEBUG or not to see
     # more details on the log
     LOG_LEVEL = LogLevel.INFO
 
+    # Already configured with the same level: dictConfig would only
+    # tear down and reinstall the same handlers
+    if _CONFIGURED_LEVEL == LOG_LEVEL:
+        return
+
     if LOG_LEVEL == LogLevel.DEBUG:
         log_format = "%(log_color)s [%(levelname)s] (%(module)s): %(message)s"
     else:
@@ -67,3 +77,4 @@ def setup_logging(settings=None) -> None:
     }
 
     dictConfig(LOGGING_CONFIG)
+    _CONFIGURED_LEVEL = LOG_LEVEL
@@ -8,9 +8,36 @@ It also updates static badges in README.md directly.
 """
 
 import json
+import os
 import re
 from pathlib import Path
 
+# Folder name prefix (before the first "_") → institute key in stats
+INSTITUTE_PREFIXES = {
+    "ipsos": "ipsos",
+    "elabe": "elabe",
+    "ifop": "ifop",
+    "odoxa": "odoxa",
+    "cluster17": "cluster17",
+}
+
+
+# Badge label → (stats key, badge color) for the static README badges
+BADGES = {
+    "IPSOS": ("ipsos", "blue"),
+    "ELABE": ("elabe", "green"),
+    "IFOP": ("ifop", "orange"),
+    "ODOXA": ("odoxa", "red"),
+    "Cluster17": ("cluster17", "purple"),
+    "Total": ("total", "brightgreen"),
+}
+
+# Badges are pure ASCII, so the README is matched as raw UTF-8 bytes (no decode/encode)
+BADGE_PATTERN = re.compile(
+    rb"!\[(?P<label>" + "|".join(BADGES).encode("ascii") + rb") Polls\]"
+    rb"\(https://img\.shields\.io/badge/(?P=label)-\d+_sondages-(?P<color>[a-z]+)\)"
+)
+
 
 def count_polls_by_institute():
     """Count polls by institute from the polls/ directory."""
@@ -23,32 +50,23 @@ def count_polls_by_institute():
         return stats
 
     # Count polls by checking folder names with CSV files
-    for folder in polls_dir.iterdir():
-        if not folder.is_dir():
-            continue
-
-        folder_name = folder.name.lower()
-
-        # Check if folder contains CSV files (actual poll data)
-        csv_files = list(folder.glob("*.csv"))
-        if not csv_files:
-            continue
-
-        # Count by institute based on folder name prefix
-        if folder_name.startswith("ipsos_"):
-            stats["ipsos"] += 1
-            stats["total"] += 1
-        elif folder_name.startswith("elabe_"):
-            stats["elabe"] += 1
-            stats["total"] += 1
-        elif folder_name.startswith("ifop_"):
-            stats["ifop"] += 1
-            stats["total"] += 1
-        elif folder_name.startswith("odoxa_"):
-            stats["odoxa"] += 1
-            stats["total"] += 1
-        elif folder_name.startswith("cluster17_"):
-            stats["cluster17"] += 1
+    with os.scandir(polls_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+
+            # Count by institute based on folder name prefix
+            prefix, separator, _ = entry.name.lower().partition("_")
+            institute = INSTITUTE_PREFIXES.get(prefix) if separator else None
+            if institute is None:
+                continue
+
+            # Check if folder contains CSV files (actual poll data)
+            with os.scandir(entry.path) as files:
+                if not any(f.name.endswith(".csv") for f in files):
+                    continue
+
+            stats[institute] += 1
             stats["total"] += 1
 
     return stats
@@ -63,46 +81,27 @@ def update_readme_badges(readme_path: Path, stats: dict) -> bool:
         print(f"⚠️  Warning: {readme_path} not found")
         return False
 
-    content = readme_path.read_text(encoding="utf-8")
+    content = readme_path.read_bytes()
     original_content = content
 
-    # Patterns to match each institute badge (static badges)
-    patterns = {
-        "ipsos": (
-            r"!\[IPSOS Polls\]\(https://img\.shields\.io/badge/IPSOS-\d+_sondages-blue\)",
-            lambda c: f"![IPSOS Polls](https://img.shields.io/badge/IPSOS-{c}_sondages-blue)",
-        ),
-        "elabe": (
-            r"!\[ELABE Polls\]\(https://img\.shields\.io/badge/ELABE-\d+_sondages-green\)",
-            lambda c: f"![ELABE Polls](https://img.shields.io/badge/ELABE-{c}_sondages-green)",
-        ),
-        "ifop": (
-            r"!\[IFOP Polls\]\(https://img\.shields\.io/badge/IFOP-\d+_sondages-orange\)",
-            lambda c: f"![IFOP Polls](https://img.shields.io/badge/IFOP-{c}_sondages-orange)",
-        ),
-        "odoxa": (
-            r"!\[ODOXA Polls\]\(https://img\.shields\.io/badge/ODOXA-\d+_sondages-red\)",
-            lambda c: f"![ODOXA Polls](https://img.shields.io/badge/ODOXA-{c}_sondages-red)",
-        ),
-        "cluster17": (
-            r"!\[Cluster17 Polls\]\(https://img\.shields\.io/badge/Cluster17-\d+_sondages-purple\)",
-            lambda c: f"![Cluster17 Polls](https://img.shields.io/badge/Cluster17-{c}_sondages-purple)",
-        ),
-        "total": (
-            r"!\[Total Polls\]\(https://img\.shields\.io/badge/Total-\d+_sondages-brightgreen\)",
-            lambda c: f"![Total Polls](https://img.shields.io/badge/Total-{c}_sondages-brightgreen)",
-        ),
-    }
-
-    # Update each badge
-    for key, (pattern, replacement_fn) in patterns.items():
-        count = stats.get(key, 0)
-        replacement = replacement_fn(count)
-        content = re.sub(pattern, replacement, content)
+    # No badge in the README: nothing to substitute
+    if b"shields.io/badge/" not in content:
+        return False
+
+    # Update every badge in a single pass over the README
+    def render_badge(match: re.Match) -> bytes:
+        label = match.group("label").decode("ascii")
+        key, color = BADGES[label]
+        if match.group("color").decode("ascii") != color:
+            return match.group(0)
+        badge = f"![{label} Polls](https://img.shields.io/badge/{label}-{stats.get(key, 0)}_sondages-{color})"
+        return badge.encode("ascii")
+
+    content = BADGE_PATTERN.sub(render_badge, content)
 
     # Write back if modified
     if content != original_content:
-        readme_path.write_text(content, encoding="utf-8")
+        readme_path.write_bytes(content)
         return True
     return False
 
@@ -125,8 +124,7 @@ def main():
 
     # Write to stats.json
     stats_file = Path("stats.json")
-    with open(stats_file, "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    stats_file.write_text(json.dumps(stats, indent=2, ensure_ascii=False), encoding="utf-8")
 
     print(f"\n✅ Stats written to {stats_file}")
 
@@ -1,5 +1,7 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -29,6 +31,29 @@ class BasePipeline(ABC):
 
     REQUIRED_METADATA_FIELDS = {"poll_id", "pdf_url"}
 
+    # Bannières des étapes de `run()`, formatées une seule fois (titre + séparateur)
+    SEPARATOR = "=" * 70
+    STAGE_BANNERS = {
+        "validate": f"📄  Validation du fichier << metadata.txt >>...\n{SEPARATOR}",
+        "cleanup": f"🧹 Nettoyage des anciens fichiers avant traitement...\n{SEPARATOR}",
+        "extract": f"🔍  Détection et extraction des pages de données... \n{SEPARATOR}",
+        "build": f"📦  Extraction et construction des CSV...\n{SEPARATOR}",
+    }
+
+    # Nombre de fichiers à partir duquel les suppressions sont réparties sur plusieurs threads
+    PARALLEL_UNLINK_THRESHOLD = 8
+    MAX_UNLINK_WORKERS = 8
+
+    # Logger partagé par toutes les instances d'une même classe (voir `__init_subclass__`)
+    logger: logging.Logger
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Résout le logger une seule fois par sous-classe, nommé d'après la classe.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(self, pdf_path: Path, poll_type: str):
         """
         Initialise le processus du pipeline.
@@ -42,9 +67,12 @@ class BasePipeline(ABC):
 
         self.pdf_path: Path = pdf_path
         self.poll_type: str = poll_type
-        self.logger = logging.getLogger(self.__class__.__name__)
         self._validate_inputs()
 
+        # Chemins dérivés du PDF, calculés une seule fois
+        self._parent_dir: Path = pdf_path.parent
+        self._metadata_path: Path = self._parent_dir / "metadata.txt"
+
     def _validate_inputs(self) -> None:
         """
         Valide les paramètres fournis au constructeur.
@@ -101,31 +129,58 @@ class BasePipeline(ABC):
         - Contenir des paires clé:valeur.
         - Définir tous les champs obligatoires listés dans `REQUIRED_METADATA_FIELDS`.
         """
-        metadata_file = Path(self.pdf_path.parent) / "metadata.txt"
+        metadata_file = self._metadata_path
         if not metadata_file.is_file():
             raise FileNotFoundError(f"<< metadata.txt >> requis mais absent : {metadata_file}")
         self.logger.info("✅  << metadata.txt >> détecté")
 
         metadata: dict[str, str] = {}
-        for line_number, raw_line in enumerate(metadata_file.read_text(encoding="utf-8").splitlines(), start=1):
-            line = raw_line.strip()
+        with metadata_file.open("r", encoding="utf-8") as f:
+            for line_number, raw_line in enumerate(f, start=1):
+                raw_line = raw_line.rstrip("\r\n")
+                line = raw_line.strip()
 
-            # ignorer lignes vides et commentaires
-            if not line or line.startswith("#"):
-                continue
+                # ignorer lignes vides et commentaires
+                if not line or line.startswith("#"):
+                    continue
 
-            if ":" not in line:
-                raise ValueError(f"Structure invalide dans metadata.txt " f"(ligne {line_number}) : '{raw_line}'")
+                if ":" not in line:
+                    raise ValueError(f"Structure invalide dans metadata.txt " f"(ligne {line_number}) : '{raw_line}'")
 
-            key, value = line.split(":", 1)
-            metadata[key.strip()] = value.strip()
+                key, value = line.split(":", 1)
+                metadata[key.strip()] = value.strip()
 
-        missing_fields = self.REQUIRED_METADATA_FIELDS - metadata.keys()
+        missing_fields = self.REQUIRED_METADATA_FIELDS.difference(metadata)
         if missing_fields:
             raise ValueError(f"Champs obligatoires manquants dans metadata.txt : {sorted(missing_fields)}")
 
         self.logger.info("📄  Structure de << metadata.txt >> validée")
 
+    @staticmethod
+    def _find_files(base_path: Path, suffixes: tuple[str, ...]) -> list[str]:
+        """
+        Parcourt récursivement `base_path` en une seule passe (`os.walk`, sans suivre les liens
+        symboliques) et retourne les chemins des fichiers dont le nom se termine par l'un des
+        `suffixes`, hors `metadata.txt`.
+        """
+        return [
+            os.path.join(dirpath, name)
+            for dirpath, _, filenames in os.walk(base_path, followlinks=False)
+            for name in filenames
+            if name.endswith(suffixes) and name != "metadata.txt"
+        ]
+
+    @staticmethod
+    def _unlink(path: str) -> OSError | None:
+        """
+        Supprime un fichier et retourne l'exception rencontrée (None si succès).
+        """
+        try:
+            os.unlink(path)
+            return None
+        except OSError as e:
+            return e
+
     def _cleanup_existing_files(self, extensions=("csv", "txt")) -> None:
         """
         Supprime les anciens fichiers avant le traitement si nécessaire.
@@ -134,25 +189,26 @@ class BasePipeline(ABC):
         récursivement dans le répertoire du PDF, à l’exception de `metadata.txt`.
         """
         try:
-            base_path = self.pdf_path.parent
-            files_to_delete = []
+            base_path = self._parent_dir
 
-            # Rechercher tous les fichiers correspondants
-            for ext in extensions:
-                for f in base_path.rglob(f"*.{ext}"):
-                    if f.name == "metadata.txt":
-                        continue
-                    files_to_delete.append(f)
+            # Rechercher tous les fichiers correspondants (un seul parcours de l'arborescence)
+            files_to_delete = self._find_files(base_path, tuple(f".{ext}" for ext in extensions))
 
             if not files_to_delete:
                 self.logger.info(f"Aucun fichier .csv/.txt trouvé à supprimer dans : {base_path}")
                 return
 
-            for f in files_to_delete:
-                try:
-                    f.unlink()
-                except Exception as e:
-                    self.logger.error(f"Impossible de supprimer le fichier : {f} ({e})")
+            # Suppressions en parallèle (appels système indépendants) au-delà d'un certain volume
+            if len(files_to_delete) < self.PARALLEL_UNLINK_THRESHOLD:
+                errors = list(map(self._unlink, files_to_delete))
+            else:
+                with ThreadPoolExecutor(max_workers=self.MAX_UNLINK_WORKERS) as executor:
+                    errors = list(executor.map(self._unlink, files_to_delete))
+
+            # Un seul message pour l'ensemble des échecs (formatage différé par le logger)
+            failures = [(f, e) for f, e in zip(files_to_delete, errors) if e is not None]
+            if failures:
+                self.logger.error("Échec de suppression pour %d fichier(s) : %s", len(failures), failures[:10])
 
             self.logger.info(f"{len(files_to_delete)} ancien(s) fichier(s) supprimé(s) dans : {base_path}")
 
@@ -172,28 +228,23 @@ class BasePipeline(ABC):
         Toute erreur rencontrée durant l’exécution est journalisée puis relancée.
         """
         try:
-            self.logger.info("📄  Validation du fichier << metadata.txt >>...")
-            self.logger.info("=" * 70)
+            self.logger.info(self.STAGE_BANNERS["validate"])
             self._validate_metadata()
             self.logger.info("")
 
-            self.logger.info("🧹 Nettoyage des anciens fichiers avant traitement...")
-            self.logger.info("=" * 70)
+            self.logger.info(self.STAGE_BANNERS["cleanup"])
             self._cleanup_existing_files()
             self.logger.info("")
 
-            self.logger.info("🔍  Détection et extraction des pages de données... ")
-            self.logger.info("=" * 70)
+            self.logger.info(self.STAGE_BANNERS["extract"])
             survey_metadata, surveys = self.extract()
             self.logger.info("")
 
-            self.logger.info("📦  Extraction et construction des CSV...")
-            self.logger.info("=" * 70)
+            self.logger.info(self.STAGE_BANNERS["build"])
             nb_csv_created = self.build(survey_metadata, surveys)
             self.logger.info("")
 
-            self.logger.info("=" * 70)
-            self.logger.info(f"✅  {nb_csv_created} fichier(s) CSV généré(s)")
+            self.logger.info(f"{self.SEPARATOR}\n✅  {nb_csv_created} fichier(s) CSV généré(s)")
             self.logger.info("")
 
         except FileNotFoundError as e:
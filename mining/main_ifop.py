@@ -13,7 +13,6 @@ output_path = ...
 poll_type = "pt3"
 population = "all"
 
-miner = Miner()
 # Traitement du PDF
 miner = Miner()
 miner.load_pdf(pdf_path, score_number, pages=pages)
@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 import pandas as pd
 import pathlib
 from pathlib import Path
@@ -12,6 +13,9 @@ class AnomalyDetector:
     Vérifie les identifiants manquants et les incohérences dans les totaux d’intention
     """
 
+    # Attributs d'instance fixes : pas de __dict__ par instance
+    __slots__ = ("df", "path", "logger")
+
     REQUIRED_COLUMNS_CANDIDATE = {"candidate_id", "candidate"}
 
     REQUIRED_COLUMNS_INTENTION = {
@@ -21,30 +25,40 @@ class AnomalyDetector:
         "intention_mention_4",
     }
 
-    def __init__(self, df: pd.DataFrame, path: pathlib.Path) -> None:
+    # Lignes de séparation du rapport d'anomalies
+    REPORT_SEPARATOR = "=" * 80 + "\n"
+    REPORT_DASH_LINE = "-" * 80 + "\n\n"
+
+    # Scores affichés dans le rapport, dans l'ordre des mentions
+    REPORT_SCORE_COLUMNS = ("intention_mention_1", "intention_mention_2", "intention_mention_3", "intention_mention_4")
+
+    def __init__(self, df: pd.DataFrame, path: pathlib.Path, validate: bool = True) -> None:
         """
         Initialise le constructeur du du générateur d'anomalies TXT.
 
         Args:
-            df (pd.DataFrame): DataFrame du sondage avec les colonnes intention_mention_1..4
+            df (pd.DataFrame): DataFrame du sondage avec les colonnes intention_mention_1..4.
+                Il n'est pas copié : les lignes normalisées sont modifiées en place.
 
             path (Path): Répertoire où seront enregistrés les anomalies en fichier TXT.
+
+            validate (bool): Valide les paramètres d'entrée (défaut). Peut être désactivé par un
+                appelant qui a déjà vérifié le DataFrame et le répertoire (ex. CSVBuilder).
         """
-        self.df: pd.DataFrame = df.copy()
+        self.df: pd.DataFrame = df
         self.path: Path = path
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._validate_inputs()
+        if validate:
+            self._validate_inputs()
 
     def _validate_inputs(self) -> None:
         """
         Valide les paramètres d'entrée.
         """
-        if not isinstance(self.df, pd.DataFrame):
-            self.logger.error("Le paramètre 'df' doit être un objet pandas.DataFrame")
-            raise TypeError("Le paramètre 'df' doit être un objet pandas.DataFrame")
-        if self.df.empty:
-            self.logger.error("Le paramètre 'df' doit être un objet pandas.DataFrame")
-            raise TypeError("Le paramètre 'df' doit être un objet pandas.DataFrame")
+        # `len(df.index)` : test de vacuité sans passer par `df.empty` (qui inspecte aussi les colonnes)
+        if not isinstance(self.df, pd.DataFrame) or len(self.df.index) == 0:
+            self.logger.error("Le paramètre 'df' doit être un objet pandas.DataFrame non vide")
+            raise TypeError("Le paramètre 'df' doit être un objet pandas.DataFrame non vide")
 
         if not isinstance(self.path, Path):
             self.logger.error("Le paramètre 'path' doit être une instance de pathlib.Path.")
@@ -70,12 +84,16 @@ class AnomalyDetector:
 
         try:
 
-            missing_cols = self.REQUIRED_COLUMNS_CANDIDATE - set(self.df.columns)
+            missing_cols = self.REQUIRED_COLUMNS_CANDIDATE.difference(self.df.columns)
             if missing_cols:
                 raise KeyError(f"Colonnes manquantes dans le DataFrame : {missing_cols}")
 
             # Détecter les valeurs nulles ou vides dans candidate_id
-            mask_missing = self.df["candidate_id"].isna() | (self.df["candidate_id"].astype(str).str.strip() == "")
+            # (les chaînes ne sont testées que si la colonne peut en contenir, sans conversion astype(str))
+            candidate_ids = self.df["candidate_id"]
+            mask_missing = candidate_ids.isna()
+            if pd.api.types.is_string_dtype(candidate_ids.dtype):
+                mask_missing |= candidate_ids.str.strip().eq("")
 
             # Extraire les noms des candidats dont l'identifiant de candidat est manquant
             missing_rows = self.df.loc[mask_missing, "candidate"].dropna().tolist()
@@ -109,45 +127,59 @@ class AnomalyDetector:
 
         try:
             required_columns = self.REQUIRED_COLUMNS_CANDIDATE | self.REQUIRED_COLUMNS_INTENTION
-            missing_cols = required_columns - set(self.df.columns)
+            missing_cols = required_columns.difference(self.df.columns)
             if missing_cols:
                 raise KeyError(f"Colonnes manquantes dans le DataFrame : {missing_cols}")
 
-            cols = list(self.REQUIRED_COLUMNS_INTENTION)
-
-            # Calculs
-            self.df["total_intention"] = self.df[cols].sum(axis=1)
-            self.df["difference"] = self.df["total_intention"] - 100
-
-            # Masques
-            mask_inconsistent = self.df["difference"] != 0
-            mask_remove = mask_inconsistent & (self.df["difference"].abs() > 4)
-            mask_normalize = mask_inconsistent & (self.df["difference"].abs() <= 4)
-
-            # Snapshot pour le rapport avant modification
-            rows = self.df.loc[mask_inconsistent].copy()
-            report_rows = rows[list(required_columns) + ["total_intention", "difference"]].to_dict(orient="records")
+            # Ordre fixe des mentions : départage déterministe des plus grands restes à égalité
+            cols = sorted(self.REQUIRED_COLUMNS_INTENTION)
+
+            # Calculs sur un tableau NumPy 2-D (valeurs manquantes comptées 0, comme `sum(skipna=True)`),
+            # sans ajout de colonnes au DataFrame
+            intentions = self.df[cols]
+            total_intention = intentions.to_numpy(dtype=np.float64, na_value=0).sum(axis=1)
+            if all(pd.api.types.is_integer_dtype(dtype) for dtype in intentions.dtypes):
+                # Totaux entiers dans le rapport (ex. 98 et non 98.0)
+                total_intention = total_intention.astype(np.int64)
+            difference = total_intention - 100
+
+            # Masques (écart absolu calculé une seule fois)
+            abs_difference = np.abs(difference)
+            mask_inconsistent = abs_difference != 0
+            mask_remove = mask_inconsistent & (abs_difference > 4)
+            mask_normalize = mask_inconsistent & (abs_difference <= 4)
+
+            # Snapshot pour le rapport avant modification (seules les colonnes du rapport sont extraites)
+            report_rows = (
+                self.df.loc[mask_inconsistent, list(required_columns)]
+                .assign(
+                    total_intention=total_intention[mask_inconsistent],
+                    difference=difference[mask_inconsistent],
+                )
+                .to_dict(orient="records")
+            )
 
             # Normalisation
             if mask_normalize.any():
-                idx = self.df.loc[mask_normalize].index
+                idx = self.df.index[mask_normalize]
 
-                normalized_intentions = normalize_to_100(
-                    self.df.loc[idx],
-                    cols,
-                )
+                # Seules les colonnes d'intention sont extraites ; résultat entier de somme 100
+                normalized_intentions = normalize_to_100(self.df.loc[idx, cols], cols)
 
                 self.df.loc[idx, cols] = normalized_intentions
 
             # Suppression des lignes hors tolérance
-            removed_count = int(mask_remove.sum())
-            self.df = self.df.loc[~mask_remove].reset_index(drop=True)
+            removed_count = int(np.count_nonzero(mask_remove))
+            # Sélection positionnelle directe, puis index renuméroté sans recopie
+            kept_rows = np.flatnonzero(~mask_remove)
+            self.df = self.df.take(kept_rows)
+            self.df.index = pd.RangeIndex(len(kept_rows))
 
             return {
                 "count": len(report_rows),
                 "rows": report_rows,
                 "removed_count": removed_count,
-                "normalized_count": int(mask_normalize.sum()),
+                "normalized_count": int(np.count_nonzero(mask_normalize)),
             }
 
         except KeyError as e:
@@ -201,8 +233,12 @@ class AnomalyDetector:
                 False → en cas d’erreur lors de la création ou de l’écriture du fichier.
         """
 
+        # Champs du sondage utilisés dans tout le rapport
+        population = survey.get("Population")
+        page = survey.get("Page")
+
         # Construire le chemin de sortie
-        filename = f"mining_anomalie_{survey.get("Population")}.txt"
+        filename = f"mining_anomalie_{population}.txt"
         output_path = Path(self.path) / filename
 
         try:
@@ -213,138 +249,130 @@ class AnomalyDetector:
 
             if candidates_id["count"] == 0 and intentions["count"] == 0:
                 self.logger.info(
-                    f"\t📝 Aucune anomalie détectée pour la population « {survey.get('Population')} » — aucun fichier généré."
+                    "\t📝 Aucune anomalie détectée pour la population « %s » — aucun fichier généré.", population
                 )
                 return False
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write("=" * 80 + "\n")
-                f.write("RAPPORT D'ANOMALIES - EXTRACTION CLUSTER 17\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(f"Population: {survey.get("Population")}\n")
-                f.write(f"Nombre d'anomalies: {candidates_id['count'] + intentions['count']}\n\n")
-                f.write("=" * 80 + "\n\n")
-
-                count_total = 1
-
-                # -----------------------------------------------------------------
-                # Le candidat n’a pas été trouvé
-                # -----------------------------------------------------------------
-                if candidates_id["names"]:
-                    for name in candidates_id["names"]:
-                        f.write(f"ANOMALIE #{count_total}\n")
-                        f.write("-" * 80 + "\n\n")
-                        f.write(f"Page:\t\t\t{survey.get("Page")}\n")
-                        f.write(f"Candidat:\t\t{name}\n")
-                        f.write(f"Population:\t\t{survey.get("Population")}\n\n")
-                        f.write("Description:\n")
-                        f.write(
-                            "\tLe candidat n’a pas été trouvé dans le fichier « candidates.csv ».\n"
-                            "\tIl est possible que ce candidat n’existe pas dans la base de référence "
-                            "ou qu’une erreur orthographique soit présente dans le nom.\n\n"
-                        )
+            # Le rapport est construit en mémoire puis écrit en une seule fois
+            parts: list[str] = [
+                self.REPORT_SEPARATOR,
+                "RAPPORT D'ANOMALIES - EXTRACTION CLUSTER 17\n",
+                self.REPORT_SEPARATOR + "\n",
+                f"Population: {population}\n",
+                f"Nombre d'anomalies: {candidates_id['count'] + intentions['count']}\n\n",
+                self.REPORT_SEPARATOR + "\n",
+            ]
+
+            count_total = 1
+
+            # -----------------------------------------------------------------
+            # Le candidat n’a pas été trouvé
+            # -----------------------------------------------------------------
+            if candidates_id["names"]:
+                for name in candidates_id["names"]:
+                    parts.append(
+                        f"ANOMALIE #{count_total}\n"
+                        f"{self.REPORT_DASH_LINE}"
+                        f"Page:\t\t\t{page}\n"
+                        f"Candidat:\t\t{name}\n"
+                        f"Population:\t\t{population}\n\n"
+                        "Description:\n"
+                        "\tLe candidat n’a pas été trouvé dans le fichier « candidates.csv ».\n"
+                        "\tIl est possible que ce candidat n’existe pas dans la base de référence "
+                        "ou qu’une erreur orthographique soit présente dans le nom.\n\n"
+                        "ACTION REQUISE :\n"
+                        "\t1. Ouvrez le fichier « candidates.csv »\n"
+                        f"\t2. Vérifiez si le candidat « {name} » est présent dans la base de référence.\n"
+                        "\t3. Si le nom existe déjà mais avec une orthographe différente (accents, espaces, etc.),\n"
+                        "\t   ne modifiez PAS le fichier « candidates.csv ».\n"
+                        "\t   Dans ce cas, vous pouvez :\n"
+                        "\t     Renseigner manuellement la colonne « candidate_id » directement\n"
+                        "\t     dans le fichier CSV de l’enquête concernée.\n"
+                        "\t4. Si le candidat est absent, ajoutez-le manuellement dans « candidates.csv ».\n"
+                        "\t   Dans ce cas, vous pouvez :\n"
+                        "\t     Relancer le processus d'extraction des données.\n\n"
+                    )
 
-                        f.write("ACTION REQUISE :\n")
-                        f.write("\t1. Ouvrez le fichier « candidates.csv »\n")
-                        f.write(f"\t2. Vérifiez si le candidat « {name} » est présent dans la base de référence.\n")
-                        f.write(
-                            "\t3. Si le nom existe déjà mais avec une orthographe différente (accents, espaces, etc.),\n"
-                            "\t   ne modifiez PAS le fichier « candidates.csv ».\n"
-                            "\t   Dans ce cas, vous pouvez :\n"
-                            "\t     Renseigner manuellement la colonne « candidate_id » directement\n"
-                            "\t     dans le fichier CSV de l’enquête concernée.\n"
-                        )
-                        f.write(
-                            "\t4. Si le candidat est absent, ajoutez-le manuellement dans « candidates.csv ».\n"
-                            "\t   Dans ce cas, vous pouvez :\n"
-                            "\t     Relancer le processus d'extraction des données.\n\n"
+                    count_total += 1
+                    parts.append(self.REPORT_SEPARATOR + "\n")
+
+            # -----------------------------------------------------------------
+            # Le total des intentions ne correspond pas à 100 %
+            # -----------------------------------------------------------------
+            if intentions["count"] > 0:
+                for row in intentions["rows"]:
+                    # --- Scores / Détails ---
+                    scores_clean = [s for s in map(row.get, self.REPORT_SCORE_COLUMNS) if s is not None]
+
+                    diff = row["difference"]
+                    sign = "+" if diff > 0 else ""
+
+                    parts.append(
+                        f"ANOMALIE #{count_total}\n"
+                        f"{self.REPORT_DASH_LINE}"
+                        f"Page:\t\t\t\t{page}\n"
+                        f"Candidat:\t\t\t{row['candidate']}\n"
+                        f"Population:\t\t\t{population}\n\n"
+                        f"Scores extraits:\t{scores_clean}\n"
+                        f"Total:\t\t\t\t{row['total_intention']}% (attendu 100%)\n"
+                        f"Différence:\t\t\t{sign}{diff}%\n\n"
+                        "Description:\n"
+                        "\tLe total des intentions de vote pour ce candidat ne correspond pas à 100 %.\n"
+                        "\tCela indique une incohérence dans les pourcentages extraits depuis le PDF, "
+                        "qui peut être due à une erreur de reconnaissance, à une valeur manquante ou à un doublon.\n\n"
+                    )
+
+                    if abs(diff) > 4:
+                        parts.append(
+                            "ACTION AUTOMATIQUE :\n"
+                            "\tCe candidat a été supprimé automatiquement du fichier CSV "
+                            "car son écart d’intention dépasse ±4%.\n\n"
                         )
 
-                        count_total += 1
-                        f.write("=" * 80 + "\n\n")
-
-                # -----------------------------------------------------------------
-                # Le total des intentions ne correspond pas à 100 %
-                # -----------------------------------------------------------------
-                if intentions["count"] > 0:
-                    for row in intentions["rows"]:
-                        f.write(f"ANOMALIE #{count_total}\n")
-                        f.write("-" * 80 + "\n\n")
-                        f.write(f"Page:\t\t\t\t{survey.get("Page")}\n")
-                        f.write(f"Candidat:\t\t\t{row['candidate']}\n")
-                        f.write(f"Population:\t\t\t{survey.get("Population")}\n\n")
-
-                        # --- Scores / Détails ---
-                        scores = [
-                            row.get("intention_mention_1", None),
-                            row.get("intention_mention_2", None),
-                            row.get("intention_mention_3", None),
-                            row.get("intention_mention_4", None),
-                        ]
-                        scores_clean = [s for s in scores if s is not None]
-                        f.write(f"Scores extraits:\t{scores_clean}\n")
-
-                        f.write(f"Total:\t\t\t\t{row['total_intention']}% (attendu 100%)\n")
-
-                        diff = row["difference"]
-                        sign = "+" if diff > 0 else ""
-                        f.write(f"Différence:\t\t\t{sign}{diff}%\n\n")
-
-                        f.write("Description:\n")
-                        f.write(
-                            "\tLe total des intentions de vote pour ce candidat ne correspond pas à 100 %.\n"
-                            "\tCela indique une incohérence dans les pourcentages extraits depuis le PDF, "
-                            "qui peut être due à une erreur de reconnaissance, à une valeur manquante ou à un doublon.\n\n"
+                    else:
+                        parts.append(
+                            "ACTION REQUISE :\n"
+                            "\t1. Ouvrez le fichier PDF de l’enquête correspondante.\n"
+                            f"\t2. Recherchez la ligne du candidat « {row['candidate']} » et vérifiez les pourcentages affichés.\n"
+                            "\t3. Si une erreur est détectée, corrigez manuellement les valeurs\n"
+                            "\t   dans le fichier CSV de la population correspondante :\n"
+                            "\t     • Pour un total supérieur à 100 %, vérifiez s’il existe un doublon ou une valeur mal lue.\n"
+                            "\t     • Pour un total inférieur à 100 %, vérifiez s’il manque une colonne ou une donnée tronquée.\n"
+                            "\t4. Enregistrez le fichier corrigé et NE RELANCEZ PAS le processus d'extraction des données.\n\n"
                         )
 
-                        if abs(row["difference"]) > 4:
-
-                            f.write("ACTION AUTOMATIQUE :\n")
-                            f.write(
-                                "\tCe candidat a été supprimé automatiquement du fichier CSV "
-                                "car son écart d’intention dépasse ±4%.\n\n"
-                            )
-
-                        else:
-                            f.write("ACTION REQUISE :\n")
-                            f.write("\t1. Ouvrez le fichier PDF de l’enquête correspondante.\n")
-                            f.write(
-                                f"\t2. Recherchez la ligne du candidat « {row['candidate']} » et vérifiez les pourcentages affichés.\n"
-                            )
-                            f.write(
-                                "\t3. Si une erreur est détectée, corrigez manuellement les valeurs\n"
-                                "\t   dans le fichier CSV de la population correspondante :\n"
-                                "\t     • Pour un total supérieur à 100 %, vérifiez s’il existe un doublon ou une valeur mal lue.\n"
-                                "\t     • Pour un total inférieur à 100 %, vérifiez s’il manque une colonne ou une donnée tronquée.\n"
-                            )
-                            f.write(
-                                "\t4. Enregistrez le fichier corrigé et NE RELANCEZ PAS le processus d'extraction des données.\n\n"
-                            )
-
-                        count_total += 1
-                        f.write("=" * 80 + "\n\n")
-
-                f.write("\nFIN DU RAPPORT\n")
-
-                if count_total > 1:
-                    self.logger.info(f"\t📝 Anomalies exportées : {output_path}")
-
-                if candidates_id["count"] > 0:
-                    self.logger.warning(
-                        f"\t   ⚠️  {candidates_id["count"]} identifiant(s) de candidat(s) introuvable(s). "
-                        f"Vérifiez le fichier d’anomalies associé à la population « {survey.get("Population")} »."
-                    )
+                    count_total += 1
+                    parts.append(self.REPORT_SEPARATOR + "\n")
 
-                if intentions["count"] > 0:
-                    self.logger.warning(
-                        f"\t   ⚠️  {intentions["count"]} incohérence(s) détectée(s) dans les totaux d’intentions de vote. "
-                        f"Vérifiez le fichier d’anomalies associé à la population « {survey.get("Population")} »."
-                    )
+            parts.append("\nFIN DU RAPPORT\n")
 
-                if removed_count > 0:
-                    self.logger.warning(
-                        f"\t       ❌  {removed_count} candidat(s) supprimé(s) du CSV pour écart > ±4% dans les intentions."
-                    )
+            # Encodage unique du rapport complet, écrit en un seul appel (sans couche texte)
+            output_path.write_bytes("".join(parts).encode("utf-8"))
+
+            if count_total > 1:
+                self.logger.info("\t📝 Anomalies exportées : %s", output_path)
+
+            if candidates_id["count"] > 0:
+                self.logger.warning(
+                    "\t   ⚠️  %d identifiant(s) de candidat(s) introuvable(s). "
+                    "Vérifiez le fichier d’anomalies associé à la population « %s ».",
+                    candidates_id["count"],
+                    population,
+                )
+
+            if intentions["count"] > 0:
+                self.logger.warning(
+                    "\t   ⚠️  %d incohérence(s) détectée(s) dans les totaux d’intentions de vote. "
+                    "Vérifiez le fichier d’anomalies associé à la population « %s ».",
+                    intentions["count"],
+                    population,
+                )
+
+            if removed_count > 0:
+                self.logger.warning(
+                    "\t       ❌  %d candidat(s) supprimé(s) du CSV pour écart > ±4%% dans les intentions.",
+                    removed_count,
+                )
 
             return True
 
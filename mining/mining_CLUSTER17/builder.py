@@ -1,12 +1,34 @@
+import os
 import pathlib
 import logging
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
-from core.helpers import normalize, survey_exists
+from core.helpers import append_surveys, normalize
 from mining.mining_CLUSTER17.anomaly_detector import AnomalyDetector
 
 
+@lru_cache(maxsize=1)
+def _candidate_ids_by_name(csv_path: str, mtime_ns: int, size: int) -> pd.Series:
+    """
+    Charge le fichier de référence des candidats, indexé par nom complet normalisé.
+
+    La date de modification et la taille du fichier font partie de la clé du cache :
+    le fichier n'est relu et renormalisé que s'il a changé depuis le dernier appel.
+
+    Returns:
+        pd.Series: `candidate_id` indexé par nom complet normalisé (à ne pas modifier).
+            En cas de doublon de nom, seule la première occurrence est conservée.
+    """
+    df_candidates = pd.read_csv(csv_path, usecols=["candidate_id", "name", "surname"])
+    name_norm = df_candidates["name"].apply(normalize)
+    surname_norm = df_candidates["surname"].apply(normalize)
+    candidate_ids = df_candidates["candidate_id"].set_axis((name_norm + " " + surname_norm).str.strip())
+    return candidate_ids[~candidate_ids.index.duplicated()]
+
+
 class CSVBuilder:
     """
     Classe responsable de la génération et du nettoyage des fichiers CSV
@@ -103,21 +125,23 @@ class CSVBuilder:
                 Données nettoyées, prêtes pour export CSV ou fusion avec candidats.
         """
 
-        df.columns = [normalize(col) for col in df.columns]
+        # Nouveaux libellés sans copie des données ni modification du DataFrame d'origine
+        df = df.set_axis([normalize(col) for col in df.columns], axis=1, copy=False)
         df = df.filter(items=self.COLUMNS_KEEP)
         df = df.rename(columns=self.RENAME_COLUMNS)
 
-        for col in df.columns:
-            if col != "candidate":
-                df[col] = (
-                    df[col]
-                    .astype(str)
-                    .str.replace("%", "", regex=False)
-                    .str.strip()
-                    .replace("", pd.NA)
-                    .astype(float)
-                    .astype("Int64")
-                )
+        # Toutes les colonnes numériques sont traitées en un seul bloc 2-D de chaînes NumPy
+        num_cols = [col for col in df.columns if col != "candidate"]
+        if num_cols:
+            texts = df[num_cols].to_numpy(dtype=object).astype(str)
+            values = np.full(texts.shape, np.nan)
+            # np.char.replace échoue sur un tableau vide (NumPy 2.0) : table sans lignes traitée à part
+            if texts.size:
+                texts = np.char.strip(np.char.replace(texts, "%", ""))
+                # Cellules vides → valeur manquante ; les autres sont converties en float (erreur si invalides)
+                present = texts != ""
+                values[present] = texts[present].astype(np.float64)
+            df[num_cols] = pd.DataFrame(values, index=df.index, columns=num_cols).astype("Int64")
 
         return df
 
@@ -133,7 +157,7 @@ class CSVBuilder:
         1. Vérifier l'existence du fichier de référence `candidates.csv`.
         2. Lire et normaliser les noms et prénoms du fichier des candidats.
         3. Normaliser la colonne `personnalite` du DataFrame d'enquête.
-        4. Fusionner les deux DataFrames sur le nom complet normalisé.
+        4. Associer les identifiants sur le nom complet normalisé (recherche par index).
         5. Réordonner les colonnes et signaler les identifiants manquants.
 
         Args:
@@ -151,23 +175,109 @@ class CSVBuilder:
             )
             return None
 
-        df_candidates = pd.read_csv(self.CANDIDATES_CSV)
-        df_candidates["name_norm"] = df_candidates["name"].apply(normalize)
-        df_candidates["surname_norm"] = df_candidates["surname"].apply(normalize)
-        df_candidates["candidate_norm"] = (
-            df_candidates["name_norm"].str.cat(df_candidates["surname_norm"], sep=" ").str.strip()
-        )
-
-        df["candidate_norm"] = df["candidate"].apply(normalize)
+        # Table des candidats lue et normalisée une seule fois (tant que le fichier ne change pas)
+        stat = os.stat(self.CANDIDATES_CSV)
+        candidate_ids = _candidate_ids_by_name(str(self.CANDIDATES_CSV), stat.st_mtime_ns, stat.st_size)
 
-        df_merged = df.merge(df_candidates[["candidate_norm", "candidate_id"]], on=["candidate_norm"], how="left")
+        # Recherche directe dans l'index des noms normalisés (pas de jointure ni de colonne temporaire)
+        df["candidate_id"] = df["candidate"].apply(normalize).map(candidate_ids)
 
-        df_merged.drop(columns=["candidate_norm"], inplace=True)
-        df_merged = df_merged[self.ORDERED_COLUMNS]
+        df_merged = df[self.ORDERED_COLUMNS]
         nb_missing = df_merged["candidate_id"].isnull().sum()
 
         return {"df": df_merged, "missing": nb_missing}
 
+    def _build_one(self, survey_metadata: Dict[str, Any], survey: Dict[str, Any]) -> Dict[str, Any] | None:
+        """
+        Nettoie, fusionne et écrit le fichier CSV d'un tableau extrait, puis génère son rapport d'anomalies.
+
+        Chaque tableau est traité indépendamment des autres ; seul l'enregistrement dans
+        `polls.csv` est laissé à `build_all`.
+
+        Returns:
+            Dict[str, Any] | None
+                La ligne à ajouter dans `polls.csv`, ou None si le fichier CSV n'a pas pu être écrit.
+        """
+
+        # Construire le chemin de sortie
+        filename = f"{self.path.name}_{survey['Population']}.csv"
+        output_path = Path(self.path) / filename
+
+        # -----------------------------------------------------------------
+        # Nettoyage et normalisation des données brutes
+        # -----------------------------------------------------------------
+        df = self._clean_survey_data(survey["df"])
+
+        if df.empty:
+            raise ValueError(
+                "Le tableau est invalide: DataFrame vide | "
+                f"population={survey.get('Étiquette de population', 'Inconnue')} | "
+                f"page={survey.get('Page', 'N/A')}"
+            )
+
+        missing_cols = self.EXPECTED_COLS.difference(df.columns)
+        if missing_cols:
+            raise ValueError(
+                "Le tableau est invalide: colonnes obligatoires manquantes | "
+                f"colonnes={sorted(missing_cols)} | "
+                f"population={survey.get('Étiquette de population', 'Inconnue')} | "
+                f"page={survey.get('Page', 'N/A')}"
+            )
+
+        # -----------------------------------------------------------------
+        # Fusion avec le fichier de référence des candidats
+        # -----------------------------------------------------------------
+        result = self._merge_candidates(df)
+        df = result["df"]
+
+        # -----------------------------------------------------------------
+        # Écriture et détails du fichier CSV
+        # -----------------------------------------------------------------
+        try:
+
+            # Formatage différé par le logger ; le décompte n'est calculé que si INFO est actif
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("✅ CSV généré : %s", output_path)
+                self.logger.info("\t📄 Page: %s", survey.get("Page", "N/A"))
+                self.logger.info("\t📊 %d candidats trouvés", df["candidate_id"].notnull().sum())
+                self.logger.info("\t🧠 Population : %s", survey.get("Étiquette de population", "Inconnue"))
+                self.logger.info("\t📋 Type : %s", self.poll_type)
+
+            # -----------------------------------------------------------------
+            # Génération du rapport d’anomalies
+            # -----------------------------------------------------------------
+            # Répertoire validé à la construction du builder et tableau non vide vérifié plus haut
+            anomalies = AnomalyDetector(df, self.path, validate=False)
+            df = anomalies.analyze(survey)
+            df = df[self.ORDERED_COLUMNS].copy()
+
+            # Colonnes pour la validation de la structure dans les test
+            df["intention_mention_5"] = ""
+            df["intention_mention_6"] = ""
+            df["intention_mention_7"] = ""
+            df["poll_type_id"] = self.poll_type
+            df["population"] = survey["Population"].value
+
+            df.to_csv(output_path, index=False, encoding="utf-8", lineterminator="\n")
+
+        except PermissionError as e:
+            self.logger.error(f"Permission refusée pour écrire {output_path} : {e}")
+            return None
+
+        # -----------------------------------------------------------------
+        # Sondage à ajouter dans polls.csv (écriture groupée par `build_all`)
+        # -----------------------------------------------------------------
+        return {
+            "poll_id": self.path.name,
+            "poll_type": self.poll_type,
+            "nb_people": survey_metadata["sample_size"],
+            "start_date": survey_metadata["start_date"],
+            "end_date": survey_metadata["end_date"],
+            "folder": str(self.path),
+            "population": survey["Population"].value,
+            "pdf_url": survey_metadata["pdf_url"],
+        }
+
     def build_all(self, survey_metadata, surveys) -> int:
         """
         Crée le fichier CSV nettoyé et fusionné pour une population donnée du baromètre Cluster17.
@@ -194,99 +304,25 @@ class CSVBuilder:
                 Nombre des fichiers .csv générés.
         """
 
-        nb_csv_created = 0
-
-        for survey in surveys:
-
-            # Construire le chemin de sortie
-            filename = f"{self.path.name}_{survey['Population']}.csv"
-            output_path = Path(self.path) / filename
-
-            # -----------------------------------------------------------------
-            # Nettoyage et normalisation des données brutes
-            # -----------------------------------------------------------------
-            df = self._clean_survey_data(survey["df"].copy())
-
-            if df.empty:
-                raise ValueError(
-                    "Le tableau est invalide: DataFrame vide | "
-                    f"population={survey.get('Étiquette de population', 'Inconnue')} | "
-                    f"page={survey.get('Page', 'N/A')}"
-                )
-
-            missing_cols = self.EXPECTED_COLS - set(df.columns)
-            if missing_cols:
-                raise ValueError(
-                    "Le tableau est invalide: colonnes obligatoires manquantes | "
-                    f"colonnes={sorted(missing_cols)} | "
-                    f"population={survey.get('Étiquette de population', 'Inconnue')} | "
-                    f"page={survey.get('Page', 'N/A')}"
-                )
-
-            # -----------------------------------------------------------------
-            # Fusion avec le fichier de référence des candidats
-            # -----------------------------------------------------------------
-            result = self._merge_candidates(df)
-            df = result["df"]
-
-            # -----------------------------------------------------------------
-            # Écriture et détails du fichier CSV
-            # -----------------------------------------------------------------
-            try:
-
-                self.logger.info(f"✅ CSV généré : {output_path}")
-                self.logger.info(f"\t📄 Page: {survey.get('Page', 'N/A')}")
-                self.logger.info(f"\t📊 {df['candidate_id'].notnull().sum()} candidats trouvés")
-                self.logger.info(f"\t🧠 Population : {survey.get('Étiquette de population', 'Inconnue')}")
-                self.logger.info(f"\t📋 Type : {self.poll_type}")
-
-                # -----------------------------------------------------------------
-                # Génération du rapport d’anomalies
-                # -----------------------------------------------------------------
-                anomalies = AnomalyDetector(df, self.path)
-                df = anomalies.analyze(survey)
-                df = df[self.ORDERED_COLUMNS].copy()
-
-                # Colonnes pour la validation de la structure dans les test
-                df["intention_mention_5"] = ""
-                df["intention_mention_6"] = ""
-                df["intention_mention_7"] = ""
-                df["poll_type_id"] = self.poll_type
-                df["population"] = survey["Population"].value
-
-                df.to_csv(output_path, index=False, encoding="utf-8")
-
-            except PermissionError as e:
-                self.logger.error(f"Permission refusée pour écrire {output_path} : {e}")
-                continue
-
-            # -----------------------------------------------------------------
-            # Ajouter sondage dedans polls.csv
-            # -----------------------------------------------------------------
-            poll_id = self.path.name
-
-            if survey_exists(self.POLLS_CSV, poll_id, survey["Population"].value):
-                self.logger.info(
-                    f"\t♻️  Sondage existe déjà dans << polls.csv >> (poll_id={poll_id}, population={survey['Population'].value}) — passer"
-                )
-            else:
-                new_survey = {
-                    "poll_id": poll_id,
-                    "poll_type": self.poll_type,
-                    "nb_people": survey_metadata["sample_size"],
-                    "start_date": survey_metadata["start_date"],
-                    "end_date": survey_metadata["end_date"],
-                    "folder": str(self.path),
-                    "population": survey["Population"].value,
-                    "pdf_url": survey_metadata["pdf_url"],
-                }
-
-                df_new_survey = pd.DataFrame([new_survey])
-                df_new_survey.to_csv(self.POLLS_CSV, mode="a", header=False, index=False, encoding="utf-8")
-                self.logger.info(
-                    f"\t➕  Sondage ajoutée dans << polls.csv >> (poll_id={poll_id}, population={survey['Population'].value})"
-                )
-
-            nb_csv_created += 1
+        new_surveys = [self._build_one(survey_metadata, survey) for survey in surveys]
+        new_surveys = [new_survey for new_survey in new_surveys if new_survey is not None]
+        nb_csv_created = len(new_surveys)
+
+        # -----------------------------------------------------------------
+        # Ajouter les sondages dans polls.csv (une seule lecture et une seule écriture)
+        # -----------------------------------------------------------------
+        if new_surveys:
+            for new_survey, added in zip(new_surveys, append_surveys(self.POLLS_CSV, new_surveys)):
+                poll_id, population = new_survey["poll_id"], new_survey["population"]
+                if added:
+                    self.logger.info(
+                        "\t➕  Sondage ajoutée dans << polls.csv >> (poll_id=%s, population=%s)", poll_id, population
+                    )
+                else:
+                    self.logger.info(
+                        "\t♻️  Sondage existe déjà dans << polls.csv >> (poll_id=%s, population=%s) — passer",
+                        poll_id,
+                        population,
+                    )
 
         return nb_csv_created
@@ -5,7 +5,6 @@ import logging
 from core.settings.logger import setup_logging
 from core.helpers import valid_date
 from core.population import Population
-from mining.mining_CLUSTER17.orchestrator import Cluster17Pipeline
 
 # Population de Cluster 17
 POPULATION = Population.by_survey("CLUSTER17")
@@ -41,12 +40,15 @@ def main():
     logger.info("╔═══════════════════════════════════════════════════════════════════════════╗")
     logger.info("║ 🚀  Début d’extraction du Cluster 17                                      ║")
     logger.info("╚═══════════════════════════════════════════════════════════════════════════╝")
-    logger.info(f"📄 PDF         : {args.file}")
-    logger.info(f"📅 Date        : {args.date[:4]}-{args.date[4:]}")
-    logger.info(f"📂 Sortie      : {OUTPUT_DIR}")
-    logger.info(f"👥 Candidats   : {CANDIDATES_CSV}")
+    logger.info("📄 PDF         : %s", args.file)
+    logger.info("📅 Date        : %s-%s", args.date[:4], args.date[4:])
+    logger.info("📂 Sortie      : %s", OUTPUT_DIR)
+    logger.info("👥 Candidats   : %s", CANDIDATES_CSV)
     logger.info("")
 
+    # Import différé : pdfplumber/pdfminer ne sont chargés qu'une fois les arguments validés
+    from mining.mining_CLUSTER17.orchestrator import Cluster17Pipeline
+
     pipeline = Cluster17Pipeline(args.file, poll_type="pt4")
     pipeline.run()
 
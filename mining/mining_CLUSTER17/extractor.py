@@ -7,8 +7,7 @@ import pdfplumber
 import pandas as pd
 from datetime import date
 from tabulate import tabulate
-from pdfminer.layout import LTTextContainer
-from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTChar, LTContainer, LTPage, LTTextContainer
 from core.helpers import normalize
 from core.population import Population
 
@@ -19,6 +18,8 @@ class PDFExtractor:
     à partir d'un PDF du baromètre Cluster17.
     """
 
+    __slots__ = ("pdf_path", "logger")
+
     # Colonnes à trouver dans les tableaux
     COLUMN_HEADER_PATTERNS = [
         r"vous\s+la\s+soutenez",
@@ -46,6 +47,16 @@ class PDFExtractor:
         "decembre": "12",
     }
 
+    # Mot caractéristique de chaque motif ci-dessus : recherchés isolément dans le texte brut
+    # des caractères, avant l'analyse de mise en page (voir `_may_be_relevant`)
+    COLUMN_HEADER_KEYWORDS = ("soutenez", "appreciez", "avis", "connaissez")
+
+    # Paramètres de l'analyse de mise en page (regroupement des caractères en blocs de texte).
+    # `_is_page_relevant` n'utilise que le texte et le nombre de lignes de chaque bloc :
+    # le regroupement hiérarchique des blocs (ordre de lecture, `boxes_flow`) est inutile
+    # et représente l'essentiel du coût de l'analyse.
+    LAYOUT_PARAMS = LAParams(boxes_flow=None)
+
     def __init__(self, pdf_path: pathlib.Path) -> None:
         """
         Initialise l'extracteur PDF pour le baromètre Cluster17.
@@ -126,105 +137,201 @@ class PDFExtractor:
 
         return has_title and has_table_structure and has_numeric_density and has_expected_columns
 
-    def _get_tables_population(self, page_number: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _may_contain_text(page: pdfplumber.page.Page) -> bool:
+        """
+        Indique si une page peut contenir du texte, d'après ses seules ressources.
+
+        Sans police (`Font`) ni objet externe (`XObject`, qui peut porter ses propres polices),
+        aucun caractère ne peut être dessiné : c'est le cas des pages ne contenant que des images
+        en ligne ou des tracés, pour lesquelles l'interpréteur pdfminer n'est même pas lancé.
+        """
+        resources = page.page_obj.resources or {}
+        return "Font" in resources or "XObject" in resources
+
+    @classmethod
+    def _may_be_relevant(cls, page_layout: LTContainer) -> bool:
+        """
+        Pré-filtre peu coûteux appliqué avant l'analyse de mise en page.
+
+        Les caractères bruts de la page sont lus dans l'ordre du flux PDF, qui peut différer de
+        l'ordre de lecture (ex. en-têtes dessinés ligne par ligne à travers les cellules) : les
+        expressions complètes d'en-tête de `_is_page_relevant` n'y sont donc pas recherchées.
+        Le filtre est volontairement conservateur : la page n'est écartée que si aucun mot
+        caractéristique d'un en-tête (`COLUMN_HEADER_KEYWORDS`) n'y figure, quel que soit l'ordre
+        des mots et des cellules. Les pages de couverture, de texte ou de graphiques sont ainsi
+        écartées sans regrouper leurs caractères en blocs, étape la plus coûteuse de pdfminer ;
+        toute autre page passe par l'analyse complète.
+
+        Args:
+            page_layout: Mise en page `pdfminer` non analysée (caractères `LTChar` non regroupés).
+
+        Returns:
+            bool: `False` si la page ne peut pas contenir un tableau de sondage Cluster 17.
+        """
+
+        def iter_chars(container: LTContainer):
+            for element in container:
+                if isinstance(element, LTChar):
+                    yield element.get_text()
+                elif isinstance(element, LTContainer):
+                    yield from iter_chars(element)
+
+        raw_text = "".join(iter_chars(page_layout))
+        if not raw_text.strip():
+            return False
+
+        compact_text = normalize(raw_text).replace(" ", "")
+        return any(keyword in compact_text for keyword in cls.COLUMN_HEADER_KEYWORDS)
+
+    @classmethod
+    def _analyze_layout(cls, page_layout: LTPage) -> LTPage:
+        """
+        Regroupe les caractères d'une mise en page brute en blocs de texte (`LAYOUT_PARAMS`).
+
+        L'analyse porte sur une nouvelle page `pdfminer` contenant les mêmes éléments : la mise en
+        page de pdfplumber n'est pas modifiée, et ses objets (caractères, traits…) restent ceux du
+        flux PDF pour l'extraction des tableaux.
+
+        Args:
+            page_layout: Mise en page `pdfminer` non analysée, telle que fournie par pdfplumber.
+
+        Returns:
+            LTPage: Nouvelle mise en page analysée (blocs `LTTextBox`).
+        """
+        analyzed = LTPage(page_layout.pageid, page_layout.bbox, page_layout.rotate)
+        analyzed.extend(page_layout)
+        analyzed.analyze(cls.LAYOUT_PARAMS)
+        return analyzed
+
+    def _get_tables_population(self, page: pdfplumber.page.Page) -> List[Dict[str, Any]]:
         """
         Extrait d'une page PDF les **tableaux** et les **blocs de texte (légendes ou populations)**
         qui se trouvent immédiatement au-dessus d'eux, en renvoyant les deux éléments dans une structure combinée.
 
         Args:
-            page_number: Numéro de la page à analyser (indexée 1).
-                Il doit être compris entre 1 et le nombre total de pages du PDF.
+            page: Page `pdfplumber` déjà ouverte et lue pour la détection,
+                dont les objets sont réutilisés sans relire le PDF.
 
         Returns:
             List[Dict[str, Any]]
                     Une liste de dictionnaires, où chaque élément représente un tableau et son contexte textuel associé.
         """
 
-        self.logger.debug("")
-        self.logger.debug("=" * 50)
-        self.logger.debug(f"Obtenir des tables et ses populations — Page: {page_number}")
-        self.logger.debug("=" * 50)
-        self.logger.debug("")
+        page_number = page.page_number
+        # Niveau DEBUG lu une seule fois : les messages (et l'aperçu des tableaux) ne sont formatés que s'il est actif
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        with pdfplumber.open(self.pdf_path) as pdf:
+        if debug:
+            self.logger.debug("")
+            self.logger.debug("=" * 50)
+            self.logger.debug("Obtenir des tables et ses populations — Page: %s", page_number)
+            self.logger.debug("=" * 50)
+            self.logger.debug("")
 
-            total_pages = len(pdf.pages)
+        # Détecter les tables
+        table_objects = sorted(page.find_tables(), key=lambda t: t.bbox[1])
 
-            if page_number < 1 or page_number > len(pdf.pages):
-                raise ValueError(f"Numéro de page invalide: {page_number} / {total_pages}. ")
+        if not table_objects:
+            self.logger.debug("Aucune table détectée à la page %s.", page_number)
+            return []
 
-            page = pdf.pages[page_number - 1]
+        bboxes = [t.bbox for t in table_objects]
 
-            # Détecter les tables
-            table_objects = sorted(page.find_tables(), key=lambda t: t.bbox[1])
+        self.logger.debug("Table(s) détectée(s) :\t%d ", len(table_objects))
+        self.logger.debug("")
 
-            if not table_objects:
-                self.logger.debug(f"Aucune table détectée à la page {page_number}.")
-                return []
+        # Extraire tous les mots avec coordonnées
+        words = page.extract_words(use_text_flow=True)
+
+        y_prev_bottom = 0
+        survey_data = []
+        for idx, (x0, y_top, x1, y_bottom) in enumerate(bboxes, start=1):
+            try:
+                if debug:
+                    self.logger.debug("Obtenir les information du table %d", idx)
+                    self.logger.debug("bbox table :\t(%.1f, %.1f, %.1f, %.1f)", x0, y_top, x1, y_bottom)
+
+                # Extraire texte avant la table (caption / population)
+                segment_words = [w for w in words if y_prev_bottom <= w["bottom"] <= y_top]
+                sorted_words = sorted(segment_words, key=lambda w: (w["top"], w["x0"]))
+                segment_texte = " ".join(w["text"] for w in sorted_words)
+
+                # supprimer le titre principal
+                clean_text = re.sub(
+                    r"BAROMÈTRE DES PERSONNALITÉS\s+[A-ZÉÈÊÎÔÛÂÀÙÇ\-]+", "", segment_texte, flags=re.IGNORECASE
+                ).strip()
+
+                population = None
+                population_label = None
+                if clean_text:
+                    self.logger.debug("Légende:\t%s", clean_text)
+                    population_detected = Population.detect_from_text(clean_text)
+                    if population_detected:
+                        population, population_label = population_detected
+                        self.logger.debug("population:\t%s", population)
+
+                # Extraire la table
+                df = pd.DataFrame(table_objects[idx - 1].extract())
+
+                # Nettoyage du DataFrame
+                df = df.dropna(how="all").reset_index(drop=True)
+                if not df.empty:
+                    df.columns = df.iloc[0]
+                    df = df[1:].reset_index(drop=True)
+
+                if debug:
+                    self.logger.debug("columns: %s", df.columns.tolist())
+                    self.logger.debug("Aperçu du DataFrame :\n%s", tabulate(df.head(), headers="keys", tablefmt="psql"))
+
+                survey_data.append(
+                    {
+                        "Page": page_number,
+                        "Table id": idx,
+                        "Légende de tableau": clean_text,
+                        "Population": population,
+                        "Étiquette de population": population_label,
+                        "df": df,
+                    }
+                )
+
+                y_prev_bottom = y_bottom
+                self.logger.debug("")
+            except (KeyError, IndexError, ValueError) as e:
+                self.logger.warning("Table ignorée | page=%s | table=%d | reason=%s", page_number, idx, e)
 
-            bboxes = [t.bbox for t in table_objects]
+        return survey_data
 
-            self.logger.debug(f"Table(s) détectée(s) :\t{len(table_objects)} ")
-            self.logger.debug("")
+    def _extract_tables_by_page(self) -> List[tuple[int, List[Dict[str, Any]]]]:
+        """
+        Détecte les pages qui contiennent des sondages et en extrait les tableaux.
 
-            # Extraire tous les mots avec coordonnées
-            words = page.extract_words(use_text_flow=True)
+        Une seule lecture du PDF : les caractères bruts de la mise en page pdfminer de chaque page
+        servent au pré-filtre (`_may_be_relevant`), puis à la détection (`_analyze_layout`) ; les objets
+        de la même page sont réutilisés pour extraire les tableaux.
 
-            y_prev_bottom = 0
-            survey_data = []
-            for idx, (x0, y_top, x1, y_bottom) in enumerate(bboxes, start=1):
+        Returns:
+            List[tuple[int, List[Dict[str, Any]]]]:
+                Pour chaque page pertinente, son numéro et les tableaux extraits (voir `_get_tables_population`).
+        """
+        tables_by_page: List[tuple[int, List[Dict[str, Any]]]] = []
+        with pdfplumber.open(self.pdf_path) as pdf:
+            for page in pdf.pages:
                 try:
-                    self.logger.debug(f"Obtenir les information du table {idx}")
-                    self.logger.debug(f"bbox table :\t({x0:.1f}, {y_top:.1f}, {x1:.1f}, {y_bottom:.1f})")
-
-                    # Extraire texte avant la table (caption / population)
-                    segment_words = [w for w in words if y_prev_bottom <= w["bottom"] <= y_top]
-                    sorted_words = sorted(segment_words, key=lambda w: (w["top"], w["x0"]))
-                    segment_texte = " ".join(w["text"] for w in sorted_words)
-
-                    # supprimer le titre principal
-                    clean_text = re.sub(
-                        r"BAROMÈTRE DES PERSONNALITÉS\s+[A-ZÉÈÊÎÔÛÂÀÙÇ\-]+", "", segment_texte, flags=re.IGNORECASE
-                    ).strip()
-
-                    population = None
-                    population_label = None
-                    if clean_text:
-                        self.logger.debug(f"Légende:\t{clean_text}")
-                        population_detected = Population.detect_from_text(clean_text)
-                        if population_detected:
-                            population, population_label = population_detected
-                            self.logger.debug(f"population:\t{population}")
-
-                    # Extraire la table
-                    df = pd.DataFrame(table_objects[idx - 1].extract())
-
-                    # Nettoyage du DataFrame
-                    df = df.dropna(how="all").reset_index(drop=True)
-                    if not df.empty:
-                        df.columns = df.iloc[0]
-                        df = df[1:].reset_index(drop=True)
-
-                    self.logger.debug(f"columns: {df.columns.tolist()}")
-                    self.logger.debug("Aperçu du DataFrame :\n" + tabulate(df.head(), headers="keys", tablefmt="psql"))
-
-                    survey_data.append(
-                        {
-                            "Page": page_number,
-                            "Table id": idx,
-                            "Légende de tableau": clean_text,
-                            "Population": population,
-                            "Étiquette de population": population_label,
-                            "df": df,
-                        }
-                    )
-
-                    y_prev_bottom = y_bottom
-                    self.logger.debug("")
-                except (KeyError, IndexError, ValueError) as e:
-                    self.logger.warning(f"Table ignorée | page={page_number} | table={idx} | reason={e}")
+                    if not self._may_contain_text(page):
+                        continue
 
-        return survey_data
+                    page_layout = page.layout
+                    if not self._may_be_relevant(page_layout):
+                        continue
+
+                    if self._is_page_relevant(self._analyze_layout(page_layout)):
+                        tables_by_page.append((page.page_number, self._get_tables_population(page)))
+                finally:
+                    # Libère les objets analysés de la page avant de passer à la suivante
+                    page.close()
+
+        return tables_by_page
 
     def _read_metadata_txt(self) -> Dict[str, str]:
         """
@@ -297,7 +404,7 @@ class PDFExtractor:
 
                 if re.search(r"\bm[ée]thodologie\b", page_text, flags=re.IGNORECASE):
                     methodology_text = page_text
-                    self.logger.info(f"📐  Page MÉTHODOLOGIE détectée (page {idx})")
+                    self.logger.info("📐  Page MÉTHODOLOGIE détectée (page %d)", idx)
                     break
 
         if not methodology_text:
@@ -404,31 +511,23 @@ class PDFExtractor:
         survey_metadata = self._extract_methodology_metadata()
 
         # -----------------------------------------------------------------
-        # Détection des pages pertinentes contenant des sondages
+        # Détection des pages pertinentes et extraction de leurs tableaux
         # -----------------------------------------------------------------
-        pages = list(extract_pages(str(self.pdf_path)))
-        total_pages = len(pages)
-        data_pages: List[int] = []
-
-        for page_num in range(1, total_pages + 1):
-            page_layout = pages[page_num - 1]
-            if self._is_page_relevant(page_layout):
-                data_pages.append(page_num)
+        tables_by_page = self._extract_tables_by_page()
 
-        if not data_pages:
+        if not tables_by_page:
             self.logger.warning("Aucune page pertinente détectée dans ce PDF")
             return []
 
-        self.logger.info(f"📊  {len(data_pages)} page(s) de données détectée(s) :")
+        self.logger.info("📊  %d page(s) de données détectée(s) :", len(tables_by_page))
 
         # -----------------------------------------------------------------
         # Obtenir les tableaux et les populations
         # -----------------------------------------------------------------
         surveys: List[Dict[str, Any]] = []
-        for page_number in data_pages:
-            survey_data = self._get_tables_population(page_number)
+        for page_number, survey_data in tables_by_page:
             for table in survey_data:
-                self.logger.info(f"  • Page {page_number} : {table['Étiquette de population']}")
+                self.logger.info("  • Page %s : %s", page_number, table["Étiquette de population"])
             surveys.extend(survey_data)
 
         if not surveys:
@@ -1,5 +1,4 @@
 import pathlib
-import logging
 from typing import List, Dict, Any
 from mining.base_pipeline import BasePipeline
 from mining.mining_CLUSTER17.extractor import PDFExtractor
@@ -24,7 +23,6 @@ class Cluster17Pipeline(BasePipeline):
         """
 
         super().__init__(pdf_path, poll_type)
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def extract(self) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
@@ -38,6 +36,6 @@ class Cluster17Pipeline(BasePipeline):
         """
         Générer les fichiers CSV et détecter les anomalies
         """
-        builder = CSVBuilder(self.pdf_path.parent, self.poll_type)
+        builder = CSVBuilder(self._parent_dir, self.poll_type)
         nb_csv_created = builder.build_all(survey_metadata, surveys)
         return nb_csv_created
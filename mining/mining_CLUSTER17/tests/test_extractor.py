@@ -0,0 +1,101 @@
+"""
+Tests du pré-filtre de pages de l'extracteur Cluster17 (`PDFExtractor._may_be_relevant`).
+"""
+
+import pathlib
+
+import pdfplumber
+import pytest
+from pdfminer.layout import LTChar, LTPage
+from pdfminer.pdfcolor import PREDEFINED_COLORSPACE
+from pdfminer.pdffont import PDFFont
+from pdfminer.pdfinterp import PDFGraphicState
+
+from mining.mining_CLUSTER17.extractor import PDFExtractor
+
+POLLS_DIR = pathlib.Path(__file__).parent.parent.parent.parent / "polls"
+PDF_PATHS = sorted(POLLS_DIR.glob("cluster17_*/source.pdf"))
+
+FONT = PDFFont({"FontName": "Test", "Descent": -200}, {})
+FONT_SIZE = 10.0
+CHAR_WIDTH = 0.5
+
+
+def make_page(*runs: str) -> LTPage:
+    """Construit une mise en page non analysée dont les caractères suivent l'ordre des `runs` (flux PDF)."""
+    page = LTPage(1, (0, 0, 595, 842))
+    for row, run in enumerate(runs):
+        for col, ch in enumerate(run):
+            matrix = (1, 0, 0, 1, col * FONT_SIZE * CHAR_WIDTH, 800 - row * 2 * FONT_SIZE)
+            page.add(
+                LTChar(
+                    matrix,
+                    FONT,
+                    FONT_SIZE,
+                    1,
+                    0,
+                    ch,
+                    CHAR_WIDTH,
+                    0,
+                    PREDEFINED_COLORSPACE["DeviceGray"],
+                    PDFGraphicState(),
+                )
+            )
+    return page
+
+
+def test_header_drawn_row_by_row_is_kept():
+    """En-têtes dessinés ligne par ligne à travers les cellules : aucune expression complète n'est contiguë."""
+    page = make_page(
+        # 1re ligne de chaque cellule d'en-tête
+        "Vous la",
+        "Vous l’",
+        "Vous ne l’",
+        "Vous n’avez pas d’",
+        "Vous ne la",
+        # 2e ligne de chaque cellule d'en-tête
+        "soutenez",
+        "appréciez",
+        "appréciez pas",
+        "avis sur elle",
+        "connaissez pas",
+    )
+    assert PDFExtractor._may_be_relevant(page)
+
+
+def test_cells_in_any_order_are_kept():
+    """L'ordre des cellules dans le flux n'a pas d'incidence sur le pré-filtre."""
+    page = make_page("connaissez pas", "12%", "Vous ne la", "BAROMÈTRE DES PERSONNALITÉS")
+    assert PDFExtractor._may_be_relevant(page)
+
+
+@pytest.mark.parametrize(
+    "runs",
+    [
+        (),
+        ("   ", "\n"),
+        ("BAROMÈTRE DES PERSONNALITÉS", "Méthodologie", "Échantillon de 1 000 personnes"),
+    ],
+)
+def test_pages_without_header_words_are_rejected(runs):
+    assert not PDFExtractor._may_be_relevant(make_page(*runs))
+
+
+@pytest.mark.parametrize("pdf_path", PDF_PATHS, ids=lambda path: path.parent.name)
+def test_prefilter_keeps_every_relevant_page(pdf_path):
+    """Sur les baromètres réels, le pré-filtre n'écarte aucune page détectée par l'analyse complète."""
+    extractor = PDFExtractor(pdf_path)
+    relevant_pages, kept_pages = set(), set()
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        for page in pdf.pages:
+            page_layout = page.layout
+            if extractor._is_page_relevant(extractor._analyze_layout(page_layout)):
+                relevant_pages.add(page.page_number)
+            if extractor._may_be_relevant(page_layout):
+                kept_pages.add(page.page_number)
+            page.close()
+
+    assert relevant_pages
+    assert relevant_pages <= kept_pages
+    assert len(kept_pages) < total_pages